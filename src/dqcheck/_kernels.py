@@ -0,0 +1,121 @@
+"""
+Low-level numeric check kernels.
+
+The numeric validators evaluate their predicates here, on the raw column
+buffer rather than through pandas. Plain integer columns are compared as
+integers — they cannot hold nulls, and rounding them through float64
+would make values beyond 2**53 slip past their bounds. Everything else
+goes through a float64 view with NaN for nulls; when numba is installed
+that path is JIT-compiled into a single fused loop (nulls handled
+in-loop, no intermediate allocations), otherwise it falls back to the
+equivalent vectorized NumPy expressions. numba is strictly optional —
+results are identical either way.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover
+    HAS_NUMBA = False
+
+# Predicate op codes shared with the validator dispatch.
+OP_POSITIVE = 0  # fails where value <= 0
+OP_MIN = 1       # fails where value < bound
+OP_MAX = 2       # fails where value > bound
+
+
+def _int_bound(bound: float):
+    """Integral bounds as Python ints, so int64 comparisons stay exact."""
+    return int(bound) if float(bound).is_integer() else bound
+
+
+def _int_failing_mask(arr: np.ndarray, op: int, bound: float) -> np.ndarray:
+    """Predicate over a plain integer buffer; no nulls, no rounding."""
+    if op == OP_POSITIVE:
+        return arr <= 0
+    if op == OP_MIN:
+        return arr < _int_bound(bound)
+    return arr > _int_bound(bound)
+
+
+def numeric_failing_mask(arr: np.ndarray, op: int, bound: float) -> np.ndarray:
+    """Failing mask for one predicate, dispatched on the buffer dtype."""
+    if arr.dtype.kind in "iu":
+        return _int_failing_mask(arr, op, bound)
+    return _float_failing_mask(arr, op, bound)
+
+
+def fused_numeric_masks(arr: np.ndarray, ops: np.ndarray, bounds: np.ndarray) -> np.ndarray:
+    """Failing masks for every predicate, dispatched on the buffer dtype."""
+    if arr.dtype.kind in "iu":
+        return np.stack([
+            _int_failing_mask(arr, int(op), float(bound))
+            for op, bound in zip(ops, bounds)
+        ])
+    return _float_fused_masks(arr, ops, bounds)
+
+
+if HAS_NUMBA:  # pragma: no cover
+
+    @njit(cache=True)
+    def _float_failing_mask(arr: np.ndarray, op: int, bound: float) -> np.ndarray:
+        """JIT kernel: one pass over arr, NaNs never fail."""
+        out = np.empty(arr.shape[0], dtype=np.bool_)
+        for i in range(arr.shape[0]):
+            value = arr[i]
+            if np.isnan(value):
+                out[i] = False
+            elif op == OP_POSITIVE:
+                out[i] = value <= 0.0
+            elif op == OP_MIN:
+                out[i] = value < bound
+            else:
+                out[i] = value > bound
+        return out
+
+    @njit(cache=True)
+    def _float_fused_masks(arr: np.ndarray, ops: np.ndarray, bounds: np.ndarray) -> np.ndarray:
+        """JIT kernel: evaluate every predicate in one pass over arr."""
+        out = np.empty((ops.shape[0], arr.shape[0]), dtype=np.bool_)
+        for i in range(arr.shape[0]):
+            value = arr[i]
+            if np.isnan(value):
+                for j in range(ops.shape[0]):
+                    out[j, i] = False
+            else:
+                for j in range(ops.shape[0]):
+                    if ops[j] == OP_POSITIVE:
+                        out[j, i] = value <= 0.0
+                    elif ops[j] == OP_MIN:
+                        out[j, i] = value < bounds[j]
+                    else:
+                        out[j, i] = value > bounds[j]
+        return out
+
+    # Warm the JIT cache so the first real validation run doesn't pay
+    # compilation latency.
+    _float_failing_mask(np.zeros(1, dtype=np.float64), OP_POSITIVE, 0.0)
+    _float_fused_masks(
+        np.zeros(1, dtype=np.float64),
+        np.zeros(1, dtype=np.int64),
+        np.zeros(1, dtype=np.float64),
+    )
+
+else:
+
+    def _float_failing_mask(arr: np.ndarray, op: int, bound: float) -> np.ndarray:
+        """NumPy fallback; NaN comparisons are False, so NaNs never fail."""
+        if op == OP_POSITIVE:
+            return arr <= 0.0
+        if op == OP_MIN:
+            return arr < bound
+        return arr > bound
+
+    def _float_fused_masks(arr: np.ndarray, ops: np.ndarray, bounds: np.ndarray) -> np.ndarray:
+        """NumPy fallback: one vectorized mask per predicate."""
+        return np.stack([
+            _float_failing_mask(arr, int(op), float(bound))
+            for op, bound in zip(ops, bounds)
+        ])
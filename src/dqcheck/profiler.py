@@ -4,22 +4,90 @@ Data profiling functionality.
 Generates statistical summaries and metadata about DataFrames.
 """
 
+import numpy as np
 import pandas as pd
 from  pandas.api import types as ptypes
 from typing import Any
 
+try:
+    # Optional: Arrow-backed string columns get O(1) per-row lengths from
+    # the offsets buffer instead of Python-level object iteration.
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover
+    pc = None
+
+__all__ = ["DataProfiler"]
+
+def _string_length_stats(non_null: pd.Series) -> dict[str, Any]:
+    """
+    Compute min/max/avg string length for a Series with nulls removed.
+
+    Min, max and sum are accumulated in one sweep over the values rather
+    than materializing a lengths array and reducing it three times.
+
+    Args:
+        non_null: A string-valued Series with nulls already dropped.
+
+    Returns:
+        A dictionary with min_length, max_length and avg_length.
+    """
+    if pc is not None and isinstance(non_null.dtype, pd.ArrowDtype):
+        lengths = pc.utf8_length(non_null.array._pa_array)
+        min_max = pc.min_max(lengths).as_py()
+        return {
+            "min_length": min_max["min"],
+            "max_length": min_max["max"],
+            "avg_length": round(pc.mean(lengths).as_py(), 2),
+        }
+
+    min_length = None
+    max_length = 0
+    total_length = 0
+    count = 0
+
+    for value in non_null.to_numpy():
+        # Object columns can carry non-string scalars; measure their str
+        # form, as the astype(str) coercion did.
+        length = len(value) if isinstance(value, str) else len(str(value))
+        if min_length is None or length < min_length:
+            min_length = length
+        if length > max_length:
+            max_length = length
+        total_length += length
+        count += 1
+
+    return {
+        "min_length": min_length,
+        "max_length": max_length,
+        "avg_length": round(total_length / count, 2),
+    }
+
 
 class DataProfiler:
     """Generates statistical profiles of DataFrames."""
 
-    def __init__(self, df: pd.DataFrame):
+    def __init__(self, df: pd.DataFrame, use_arrow_strings: bool = False):
         """
         Initialise the profiler with a DataFrame.
 
+        The profiler treats the DataFrame as immutable: the null mask and
+        summary are computed once and reused across calls, so mutating
+        `df` after construction gives stale results.
+
         Args:
             df: The pandas DataFrame to profile.
+            use_arrow_strings: Convert the frame to Arrow-backed dtypes on
+                ingest (requires pyarrow). String stats then run on Arrow
+                compute kernels instead of iterating Python objects.
         """
+        if use_arrow_strings:
+            if pc is None:
+                raise ImportError("use_arrow_strings=True requires pyarrow to be installed")
+            df = df.convert_dtypes(dtype_backend="pyarrow")
         self.df = df
+        self._isna = df.isna()
+        self._summary: dict[str, Any] | None = None
+        self._memory_usage_bytes: int | None = None
 
     def profile_column(self, column: str) -> dict[str, Any]:
         """
@@ -32,36 +100,36 @@ class DataProfiler:
             A dictionary containing profile statistics.
         """
         series = self.df[column]
-        
+        null_mask = self._isna[column]
+        null_count = null_mask.sum()
+
         profile = {
             "column": column,
             "dtype": str(series.dtype),
             "count": len(series),
-            "null_count": series.isna().sum(),
-            "null_percentage": round(series.isna().mean() * 100, 2),
+            "null_count": null_count,
+            "null_percentage": round(null_mask.mean() * 100, 2),
             "unique_count": series.nunique(),
         }
 
-        # Add numeric statistics if applicable
+        # Add numeric statistics if applicable, fused into one agg call
+        # rather than five separate sweeps over the column buffer
         if pd.api.types.is_numeric_dtype(series):
+            stats = series.agg(["min", "max", "mean", "median", "std"])
+            has_values = null_count < len(series)
             profile.update({
-                "min": series.min(),
-                "max": series.max(),
-                "mean": round(series.mean(), 2) if not series.isna().all() else None,
-                "median": series.median() if not series.isna().all() else None,
-                "std": round(series.std(), 2) if not series.isna().all() else None,
+                "min": stats["min"],
+                "max": stats["max"],
+                "mean": round(stats["mean"], 2) if has_values else None,
+                "median": stats["median"] if has_values else None,
+                "std": round(stats["std"], 2) if has_values else None,
             })
 
         # Add string statistics if applicable
         if pd.api.types.is_string_dtype(series) or series.dtype == "object":
             non_null = series.dropna()
             if len(non_null) > 0:
-                str_lengths = non_null.astype(str).str.len()
-                profile.update({
-                    "min_length": str_lengths.min(),
-                    "max_length": str_lengths.max(),
-                    "avg_length": round(str_lengths.mean(), 2),
-                })
+                profile.update(_string_length_stats(non_null))
 
         return profile
 
@@ -69,25 +137,121 @@ class DataProfiler:
         """
         Generate profiles for all columns in the DataFrame.
 
+        Stats are computed at DataFrame level (one aggregation per dtype
+        group) rather than column by column, so the data is only scanned
+        a handful of times regardless of how many columns there are.
+
         Returns:
             A list of profile dictionaries, one per column.
         """
-        return [self.profile_column(col) for col in self.df.columns]
+        df = self.df
+        row_count = len(df)
+
+        # One pass each for nulls and cardinality across every column.
+        isna = self._isna
+        null_counts = isna.sum(axis=0)
+        null_fractions = isna.mean(axis=0)
+        unique_counts = df.nunique()
+
+        # One agg call covers the numeric stats for every numeric column
+        # in a single fused C-level pass. is_numeric_dtype matches
+        # profile_column's notion of numeric (bool included, unlike
+        # select_dtypes), and restricting the pass to these columns skips
+        # the unique/top/freq hashing describe(include='all') would waste
+        # on every object column.
+        numeric_cols = [
+            column for column in df.columns
+            if pd.api.types.is_numeric_dtype(df[column])
+        ]
+        numeric_stats = (
+            df[numeric_cols].agg(["min", "max", "mean", "median", "std", "count"])
+            if numeric_cols else None
+        )
+
+        # Per-dtype check rather than select_dtypes so Arrow-backed string
+        # columns are picked up too.
+        string_cols = {
+            column for column in df.columns
+            if pd.api.types.is_string_dtype(df[column]) or df[column].dtype == object
+        }
+        length_stats = {}
+        for column in string_cols:
+            non_null = df[column].dropna()
+            if len(non_null) > 0:
+                length_stats[column] = _string_length_stats(non_null)
+
+        profiles = []
+        for column in df.columns:
+            profile = {
+                "column": column,
+                "dtype": str(df[column].dtype),
+                "count": row_count,
+                "null_count": null_counts[column],
+                "null_percentage": round(null_fractions[column] * 100, 2),
+                "unique_count": unique_counts[column],
+            }
+
+            if column in numeric_cols:
+                stats = numeric_stats[column]
+                has_values = stats["count"] > 0
+                profile.update({
+                    "min": stats["min"],
+                    "max": stats["max"],
+                    "mean": round(stats["mean"], 2) if has_values else None,
+                    "median": stats["median"] if has_values else None,
+                    "std": round(stats["std"], 2) if has_values else None,
+                })
+
+            if column in length_stats:
+                profile.update(length_stats[column])
+
+            profiles.append(profile)
+
+        return profiles
 
     def summary(self) -> dict[str, Any]:
         """
         Generate a high-level summary of the DataFrame.
 
+        The result is computed once and cached, so repeated calls (e.g.
+        reporting after profiling) are free.
+
         Returns:
             A dictionary containing overall DataFrame statistics.
         """
-        return {
-            "row_count": len(self.df),
-            "column_count": len(self.df.columns),
-            "columns": list(self.df.columns),
-            "memory_usage_bytes": self.df.memory_usage(deep=True).sum(),
-            "total_null_count": self.df.isna().sum().sum(),
-        }
+        if self._summary is None:
+            self._summary = {
+                "row_count": len(self.df),
+                "column_count": len(self.df.columns),
+                "columns": list(self.df.columns),
+                "memory_usage_bytes": self._deep_memory_usage(),
+                # One pass over the flat boolean buffer instead of a
+                # column-wise sum followed by a sum of the Series.
+                "total_null_count": int(np.count_nonzero(self._isna.to_numpy())),
+            }
+        return self._summary
+
+    def _deep_memory_usage(self) -> int:
+        """
+        Deep memory usage of the DataFrame, computed once.
+
+        memory_usage(deep=True) walks every Python object in object
+        columns, so the result is cached until invalidate() is called.
+        """
+        if self._memory_usage_bytes is None:
+            self._memory_usage_bytes = self.df.memory_usage(deep=True).sum()
+        return self._memory_usage_bytes
+
+    def invalidate(self) -> None:
+        """
+        Drop cached statistics after the DataFrame has been mutated.
+
+        The profiler assumes the DataFrame is immutable; call this if it
+        has been changed in place so the next calls recompute from scratch.
+        """
+        self._isna = self.df.isna()
+        self._summary = None
+        self._memory_usage_bytes = None
 
     
     @staticmethod
@@ -129,35 +293,44 @@ class DataProfiler:
         Returns:
             Prints observations and a recommended score for partitioning.
         """
-        #profile the column
-        profile_results = self.profile_column(column)
+        # Only the null count, length and distribution are needed here —
+        # a full profile_column pass would compute (and discard) all the
+        # numeric and string stats as well.
+        series = self.df[column]
+        dtype = str(series.dtype)
 
-        if not self.is_partitionable_dtype(self.df[column]) is False:
-            print(f"Column '{column}' is of type '{profile_results['dtype']}'. Not recommended for partitioning.")
+        if not self.is_partitionable_dtype(series):
+            print(f"Column '{column}' is of type '{dtype}'. Not recommended for partitioning.")
             return
         else:
-            print(f"Column '{column}' is of type '{profile_results['dtype']}'.")
+            print(f"Column '{column}' is of type '{dtype}'.")
 
-        # Check the distribution
-        distribution_df = self.df[column].value_counts(normalize=True)
+        # Check the distribution. One value_counts pass gives us cardinality,
+        # the biggest entry and the skew; sort=False skips a pointless sort.
+        distribution_df = series.value_counts(normalize=True, sort=False)
 
         print("="*40)
         print("Observations:")
 
-        if profile_results["null_count"] is not None:
-            print(f"WARNING: Null values in '{column}' column: {profile_results['null_count']} ({profile_results['null_percentage']}%)")
+        null_count = int(self._isna[column].sum())
+        if null_count > 0:
+            null_percentage = round(null_count / len(series) * 100, 2)
+            print(f"WARNING: Null values in '{column}' column: {null_count} ({null_percentage}%)")
             print("Consider handling nulls before partitioning, depending on implementation NULL values can cause data skew over time.")
-        
-        Cardinality = profile_results["unique_count"]
+
+        Cardinality = len(distribution_df)  # value_counts already did the hash pass nunique would redo
         print(f"Unique entries in 'category' column: {Cardinality}")
 
-        total_entries = profile_results["count"]
+        total_entries = len(series)
         print(f"Total entries in DataFrame: {total_entries}")
 
+        # Series.max() returns NaN on an empty distribution (all-null
+        # column, empty frame) where a raw ndarray reduction would raise.
         biggest_entry = distribution_df.max()  # Proportion of the most frequent category
         print(f"Biggest entry proportion in 'category' column: {biggest_entry:.2%}")
 
-        skew_factor = biggest_entry / distribution_df.mean()
+        # Normalized proportions sum to 1, so their mean is exactly 1/cardinality.
+        skew_factor = biggest_entry * Cardinality
         print(f"Skew factor of 'category' column: {skew_factor:.2f}. 1.0 means no skew. 2.0 means the biggest entry is twice the average.")
 
         print("="*40)
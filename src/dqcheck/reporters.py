@@ -5,15 +5,31 @@ Formats and outputs validation results and profiles.
 """
 
 import json
-from typing import Any
+from collections.abc import Sequence
+from typing import Any, TextIO
 
 from .validators import ValidationResult
 
+try:
+    # Optional: C-level serializer, numpy-scalar aware, ~3-5x stdlib json.
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def _dumps(payload: Any, indent: int) -> str:
+    """Serialize payload to a JSON string, via orjson when available."""
+    if orjson is not None and indent == 2:
+        # orjson only supports two-space indentation.
+        option = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        return orjson.dumps(payload, option=option, default=str).decode()
+    return json.dumps(payload, indent=indent, default=str)
+
 
 class ConsoleReporter:
     """Outputs validation results to the console."""
 
-    def report_validation(self, results: list[ValidationResult]) -> None:
+    def report_validation(self, results: Sequence[ValidationResult]) -> None:
         """
         Print validation results to the console.
 
@@ -77,7 +93,18 @@ class ConsoleReporter:
 class JsonReporter:
     """Outputs validation results and profiles as JSON."""
 
-    def validation_to_dict(self, results: list[ValidationResult]) -> dict[str, Any]:
+    def _result_to_dict(self, result: ValidationResult) -> dict[str, Any]:
+        """Convert a single ValidationResult to a plain dictionary."""
+        return {
+            "check_name": result.check_name,
+            "column": result.column,
+            "passed": result.passed,
+            "message": result.message,
+            "failing_count": result.failing_count,
+            "failing_examples": result.failing_examples,
+        }
+
+    def validation_to_dict(self, results: Sequence[ValidationResult]) -> dict[str, Any]:
         """
         Convert validation results to a dictionary.
 
@@ -96,20 +123,10 @@ class JsonReporter:
                 "failed": len(results) - passed,
                 "success": passed == len(results),
             },
-            "results": [
-                {
-                    "check_name": r.check_name,
-                    "column": r.column,
-                    "passed": r.passed,
-                    "message": r.message,
-                    "failing_count": r.failing_count,
-                    "failing_examples": r.failing_examples,
-                }
-                for r in results
-            ],
+            "results": [self._result_to_dict(r) for r in results],
         }
 
-    def report_validation(self, results: list[ValidationResult], indent: int = 2) -> str:
+    def report_validation(self, results: Sequence[ValidationResult], indent: int = 2) -> str:
         """
         Convert validation results to a JSON string.
 
@@ -120,7 +137,40 @@ class JsonReporter:
         Returns:
             A JSON string representation of the results.
         """
-        return json.dumps(self.validation_to_dict(results), indent=indent, default=str)
+        return _dumps(self.validation_to_dict(results), indent)
+
+    def report_validation_to_file(
+        self,
+        fp: TextIO,
+        results: Sequence[ValidationResult],
+        indent: int = 2
+    ) -> None:
+        """
+        Stream validation results as JSON to an open text file.
+
+        Results are serialized and written one at a time, so the full
+        document is never held in memory — useful for very large runs.
+
+        Args:
+            fp: An open text-mode file object to write to.
+            results: List of ValidationResult objects.
+            indent: JSON indentation level.
+        """
+        passed = sum(1 for r in results if r.passed)
+        summary = {
+            "total": len(results),
+            "passed": passed,
+            "failed": len(results) - passed,
+            "success": passed == len(results),
+        }
+
+        fp.write('{\n"summary": ')
+        fp.write(_dumps(summary, indent))
+        fp.write(',\n"results": [')
+        for i, result in enumerate(results):
+            fp.write(",\n" if i else "\n")
+            fp.write(_dumps(self._result_to_dict(result), indent))
+        fp.write("\n]\n}\n")
 
     def report_profile(
         self, 
@@ -143,4 +193,4 @@ class JsonReporter:
             "summary": summary,
             "columns": profiles,
         }
-        return json.dumps(output, indent=indent, default=str)
\ No newline at end of file
+        return _dumps(output, indent)
\ No newline at end of file
@@ -4,15 +4,106 @@ Data validation functionality.
 Provides rule-based validation checks for DataFrames.
 """
 
+import functools
+import os
+import re
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
-from typing import Any, Callable
+from typing import Any
 from dataclasses import dataclass, field
 
+from ._kernels import (
+    OP_MAX,
+    OP_MIN,
+    OP_POSITIVE,
+    fused_numeric_masks,
+    numeric_failing_mask,
+)
+
+try:
+    # Optional: Arrow-backed string columns get RE2-based matching in C++.
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover
+    pc = None
+
+try:
+    # Optional: google-re2 matches in linear time via a DFA instead of
+    # Python's backtracking engine.
+    import re2
+except ImportError:  # pragma: no cover
+    re2 = None
+
+try:
+    # Optional: numexpr fuses a chain of comparisons into one
+    # multi-threaded native loop.
+    import numexpr as ne
+except ImportError:  # pragma: no cover
+    ne = None
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(pattern: str):
+    """
+    Compile a regex pattern once and reuse it across checks and runs.
+
+    Prefers the optional google-re2 backend (DFA-based, linear time even
+    on pathological inputs); patterns using features RE2 does not support
+    (backreferences, lookaround) fall back to the stdlib engine.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+
+# Checks whose predicate runs through the numeric kernels.
+_NUMERIC_OPS = ("is_positive", "min_value", "max_value")
+
+# How many failing examples a result carries by default.
+MAX_EXAMPLES = 5
+
+# rows x queued checks above which run() fans out one thread per column.
+# Below this, thread startup costs more than it saves.
+PARALLEL_THRESHOLD = 100_000
+
+
+def _na_mask(series: pd.Series) -> np.ndarray:
+    """
+    Build the column's null mask by the cheapest route its dtype allows.
+
+    Plain NumPy integer, unsigned and bool columns cannot hold nulls, so
+    their mask is all-False with no scan at all; plain float columns get a
+    direct isnan over the buffer. Everything else — including pandas
+    extension dtypes like nullable Int64, whose missing values a raw
+    NumPy check would misread — goes through Series.isna.
+    """
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype):
+        if dtype.kind in "iub":
+            return np.zeros(len(series), dtype=bool)
+        if dtype.kind == "f":
+            return np.isnan(series.to_numpy())
+    return series.isna().to_numpy()
+
+
+def _numeric_op(spec: "CheckSpec") -> tuple[int, float]:
+    """Map a numeric CheckSpec to its kernel op code and bound."""
+    if spec.op == "is_positive":
+        return OP_POSITIVE, 0.0
+    if spec.op == "min_value":
+        return OP_MIN, float(spec.args[0])
+    return OP_MAX, float(spec.args[0])
+
 
 @dataclass
 class ValidationResult:
     """Represents the result of a single validation check."""
-    
+
     check_name: str
     passed: bool
     column: str | None = None
@@ -21,12 +112,131 @@ class ValidationResult:
     failing_examples: list[Any] = field(default_factory=list)
 
 
+class ResultBatch(Sequence):
+    """
+    Structure-of-arrays container for validation results.
+
+    One run allocates a single batch whose fields live in parallel
+    per-field lists, instead of one result object per check. Indexing
+    materializes a ValidationResult view on demand, so existing
+    `results[i].passed` style access keeps working unchanged.
+    """
+
+    __slots__ = (
+        "check_names",
+        "columns",
+        "passed",
+        "messages",
+        "failing_counts",
+        "failing_examples",
+    )
+
+    def __init__(self):
+        self.check_names: list[str] = []
+        self.columns: list[str | None] = []
+        self.passed: list[bool] = []
+        self.messages: list[str] = []
+        self.failing_counts: list[int] = []
+        self.failing_examples: list[list[Any]] = []
+
+    def add(
+        self,
+        check_name: str,
+        passed: bool,
+        column: str | None = None,
+        message: str = "",
+        failing_count: int = 0,
+        failing_examples: list[Any] | None = None,
+    ) -> None:
+        """Append one result's fields to the batch columns."""
+        self.check_names.append(check_name)
+        self.columns.append(column)
+        self.passed.append(bool(passed))
+        self.messages.append(message)
+        self.failing_counts.append(failing_count)
+        self.failing_examples.append([] if failing_examples is None else failing_examples)
+
+    def __len__(self) -> int:
+        return len(self.check_names)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return ValidationResult(
+            check_name=self.check_names[index],
+            passed=self.passed[index],
+            column=self.columns[index],
+            message=self.messages[index],
+            failing_count=self.failing_counts[index],
+            failing_examples=self.failing_examples[index],
+        )
+
+
+@dataclass(slots=True)
+class CheckSpec:
+    """A queued validation check: operation, target column and arguments."""
+
+    op: str
+    column: str | None
+    args: tuple[Any, ...] = ()
+
+
+class _ColumnContext:
+    """
+    Per-column state shared by every check on that column in a run.
+
+    The Series and null mask are resolved once; the float64 view used by
+    the numeric checks is materialized lazily on first use and reused, so
+    a chain of numeric checks walks one shared buffer instead of
+    converting the column per check.
+    """
+
+    __slots__ = ("series", "na_mask", "_numeric_arr", "masks")
+
+    def __init__(self, series: pd.Series, na_mask: np.ndarray):
+        self.series = series
+        self.na_mask = na_mask
+        self._numeric_arr: np.ndarray | None = None
+        # Predicate masks precomputed by the fused kernel (or cached by
+        # executors), keyed by (op, args).
+        self.masks: dict[tuple[str, tuple], np.ndarray] = {}
+
+    # How many masks to keep per column; enough for typical chains while
+    # bounding memory on very long ones.
+    _MASK_CACHE_SIZE = 5
+
+    def cache_mask(self, key: tuple[str, tuple], mask: np.ndarray) -> None:
+        """Cache a predicate mask so identical later checks reuse it."""
+        if key not in self.masks and len(self.masks) >= self._MASK_CACHE_SIZE:
+            # dicts iterate in insertion order, so this evicts the oldest.
+            self.masks.pop(next(iter(self.masks)))
+        self.masks[key] = mask
+
+    def numeric_arr(self) -> np.ndarray:
+        """
+        Numeric view of the column, built once.
+
+        Plain integer columns are handed over untouched — they cannot
+        hold nulls, and a float64 round-trip would corrupt values beyond
+        2**53. Everything else gets a float64 view with NaN for nulls.
+        """
+        if self._numeric_arr is None:
+            dtype = self.series.dtype
+            if isinstance(dtype, np.dtype) and dtype.kind in "iu":
+                self._numeric_arr = self.series.to_numpy(copy=False)
+            else:
+                self._numeric_arr = self.series.to_numpy(
+                    dtype=np.float64, copy=False, na_value=np.nan
+                )
+        return self._numeric_arr
+
+
 class DataValidator:
     """
     Validates DataFrames against a set of rules.
-    
+
     Provides a fluent interface for building validation checks.
-    
+
     Example:
         validator = DataValidator(df)
         results = (
@@ -45,13 +255,21 @@ class DataValidator:
             df: The pandas DataFrame to validate.
         """
         self.df = df
-        self._checks: list[tuple[str, str | None, Callable[[], ValidationResult]]] = []
+        self._checks: list[CheckSpec] = []
         self._current_column: str | None = None
+        # Column contexts resolved at chain-build time and kept across
+        # run() calls. Like the profiler's caches, this assumes the
+        # DataFrame is not mutated after the validator is created.
+        self._contexts: dict[str | None, _ColumnContext] = {}
 
     def column(self, name: str) -> "DataValidator":
         """
         Set the current column for subsequent checks.
 
+        The column's Series and null mask are resolved here, once, so no
+        check ever goes back through the DataFrame's block manager — and
+        repeated run() calls reuse the same bound context.
+
         Args:
             name: The name of the column to validate.
 
@@ -61,187 +279,530 @@ class DataValidator:
         if name not in self.df.columns:
             raise ValueError(f"Column '{name}' not found in DataFrame")
         self._current_column = name
+        self._context_for(name)
         return self
 
-    def _add_check(
-        self, 
-        check_name: str, 
-        check_fn: Callable[[], ValidationResult]
-    ) -> "DataValidator":
-        """Add a check to the validation queue."""
-        self._checks.append((check_name, self._current_column, check_fn))
+    def _first_failing(self, col: str, mask, k: int = MAX_EXAMPLES) -> list[Any]:
+        """
+        Collect the first k failing values for a column.
+
+        Picks the failing positions with np.flatnonzero and indexes the
+        column array directly, instead of materializing a boolean-sliced
+        copy of the whole DataFrame just to keep k values.
+
+        Args:
+            col: The column name.
+            mask: Boolean mask of failing rows (Series or ndarray).
+            k: Maximum number of examples to return.
+
+        Returns:
+            A list of up to k failing values.
+        """
+        idx = np.flatnonzero(np.asarray(mask))[:k]
+        return self.df[col].to_numpy()[idx].tolist()
+
+    def _add_check(self, op: str, *args: Any) -> "DataValidator":
+        """Queue a check against the current column."""
+        self._checks.append(CheckSpec(op, self._current_column, args))
         return self
 
+    # -- chain builders ---------------------------------------------------
+
     def is_not_null(self) -> "DataValidator":
         """Check that the current column contains no null values."""
-        col = self._current_column
-        
-        def check() -> ValidationResult:
-            series = self.df[col]
-            null_mask = series.isna()
-            failing = null_mask.sum()
-            
-            return ValidationResult(
+        return self._add_check("is_not_null")
+
+    def is_positive(self) -> "DataValidator":
+        """Check that numeric values in the current column are positive (> 0)."""
+        return self._add_check("is_positive")
+
+    def is_in(self, allowed_values: list[Any]) -> "DataValidator":
+        """Check that all values in the current column are in the allowed list."""
+        # De-duplicate and build a pd.Index once at build time: its C
+        # hashtable is constructed here and reused by get_indexer on every
+        # run() instead of re-hashing a Python list each time.
+        return self._add_check("is_in", pd.Index(dict.fromkeys(allowed_values)))
+
+    def matches(self, pattern: str | re.Pattern) -> "DataValidator":
+        """
+        Check that string values in the current column match a regex pattern.
+
+        Accepts either a pattern string (compiled once via the shared
+        cache) or an already compiled pattern object.
+        """
+        rx = _compile(pattern) if isinstance(pattern, str) else pattern
+        return self._add_check("matches", rx)
+
+    def min_value(self, minimum: float) -> "DataValidator":
+        """Check that numeric values are at least the specified minimum."""
+        return self._add_check("min_value", minimum)
+
+    def max_value(self, maximum: float) -> "DataValidator":
+        """Check that numeric values are at most the specified maximum."""
+        return self._add_check("max_value", maximum)
+
+    def is_unique(self) -> "DataValidator":
+        """Check that all values in the current column are unique."""
+        return self._add_check("is_unique")
+
+    # -- check executors --------------------------------------------------
+
+    def _run_is_not_null(self, spec: CheckSpec, ctx: _ColumnContext, batch: ResultBatch) -> None:
+        na_mask = ctx.na_mask
+        if not na_mask.any():
+            # any() exits at the first hit and skips the count/examples
+            # work entirely on the happy path.
+            return batch.add(
                 check_name="is_not_null",
+                column=spec.column,
+                passed=True,
+                message="No null values",
+            )
+
+        failing = int(np.count_nonzero(na_mask))
+        return batch.add(
+            check_name="is_not_null",
+            column=spec.column,
+            passed=False,
+            message=f"Found {failing} null values",
+            failing_count=failing,
+            failing_examples=ctx.series.index.take(
+                np.flatnonzero(na_mask)[:MAX_EXAMPLES]
+            ).tolist(),
+        )
+
+    def _run_is_positive(self, spec: CheckSpec, ctx: _ColumnContext, batch: ResultBatch) -> None:
+        col = spec.column
+        if not pd.api.types.is_numeric_dtype(ctx.series):
+            return batch.add(
+                check_name="is_positive",
                 column=col,
-                passed=bool(failing == 0),
-                message=f"Found {failing} null values" if failing > 0 else "No null values",
-                failing_count=failing,
-                failing_examples=self.df[null_mask].index.tolist()[:5],
+                passed=False,
+                message=f"Column '{col}' is not numeric",
             )
-        
-        return self._add_check("is_not_null", check)
 
-    def is_positive(self) -> "DataValidator":
-        """Check that numeric values in the current column are positive (> 0)."""
-        col = self._current_column
-        
-        def check() -> ValidationResult:
-            series = self.df[col]
-            if not pd.api.types.is_numeric_dtype(series):
-                return ValidationResult(
-                    check_name="is_positive",
-                    column=col,
-                    passed=False,
-                    message=f"Column '{col}' is not numeric",
-                )
-            
-            non_positive_mask = series.fillna(1) <= 0  # Ignore nulls for this check
-            failing = non_positive_mask.sum()
-            
-            return ValidationResult(
+        non_positive_mask = ctx.masks.get((spec.op, spec.args))
+        if non_positive_mask is None:
+            non_positive_mask = numeric_failing_mask(ctx.numeric_arr(), OP_POSITIVE, 0.0)  # Nulls never fail
+            ctx.cache_mask((spec.op, spec.args), non_positive_mask)
+        if not non_positive_mask.any():
+            return batch.add(
                 check_name="is_positive",
                 column=col,
-                passed=bool(failing == 0),
-                message=f"Found {failing} non-positive values" if failing > 0 else "All values positive",
-                failing_count=failing,
-                failing_examples=self.df[non_positive_mask][col].tolist()[:5],
+                passed=True,
+                message="All values positive",
             )
-        
-        return self._add_check("is_positive", check)
 
-    def is_in(self, allowed_values: list[Any]) -> "DataValidator":
-        """Check that all values in the current column are in the allowed list."""
-        col = self._current_column
-        
-        def check() -> ValidationResult:
-            series = self.df[col]
-            invalid_mask = ~series.isin(allowed_values) & series.notna()
-            failing = invalid_mask.sum()
-            
-            return ValidationResult(
+        failing = int(np.count_nonzero(non_positive_mask))
+        return batch.add(
+            check_name="is_positive",
+            column=col,
+            passed=False,
+            message=f"Found {failing} non-positive values",
+            failing_count=failing,
+            failing_examples=self._first_failing(col, non_positive_mask),
+        )
+
+    def _run_is_in(self, spec: CheckSpec, ctx: _ColumnContext, batch: ResultBatch) -> None:
+        (allowed_values,) = spec.args
+        series = ctx.series
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Compare small integer codes instead of hashing every value:
+            # map the allowed values to category codes once, then one
+            # vectorized isin over the codes array. Null rows have code -1,
+            # which never appears in allowed_codes.
+            allowed_codes = series.cat.categories.get_indexer(allowed_values)
+            allowed_codes = allowed_codes[allowed_codes >= 0]
+            invalid_mask = ~np.isin(series.cat.codes.to_numpy(), allowed_codes) & ~ctx.na_mask
+        else:
+            # One hashtable probe per row against the Index built at
+            # chain-build time; -1 marks values outside the allowed set.
+            invalid_mask = (allowed_values.get_indexer(series) == -1) & ~ctx.na_mask
+        if not invalid_mask.any():
+            return batch.add(
                 check_name="is_in",
-                column=col,
-                passed=bool(failing == 0),
-                message=f"Found {failing} values not in allowed list" if failing > 0 else "All values valid",
-                failing_count=failing,
-                failing_examples=self.df[invalid_mask][col].unique().tolist()[:5],
+                column=spec.column,
+                passed=True,
+                message="All values valid",
             )
-        
-        return self._add_check("is_in", check)
-
-    def matches(self, pattern: str) -> "DataValidator":
-        """Check that string values in the current column match a regex pattern."""
-        col = self._current_column
-        
-        def check() -> ValidationResult:
-            series = self.df[col].astype(str)
-            match_mask = series.str.match(pattern, na=False)
-            non_match_mask = ~match_mask & self.df[col].notna()
-            failing = non_match_mask.sum()
-            
-            return ValidationResult(
+
+        failing = int(np.count_nonzero(invalid_mask))
+        return batch.add(
+            check_name="is_in",
+            column=spec.column,
+            passed=False,
+            message=f"Found {failing} values not in allowed list",
+            failing_count=failing,
+            failing_examples=self._first_failing(spec.column, invalid_mask),
+        )
+
+    def _run_matches(self, spec: CheckSpec, ctx: _ColumnContext, batch: ResultBatch) -> None:
+        (rx,) = spec.args
+        series = ctx.series
+        na_mask = ctx.na_mask
+        # Flags are part of the key: the same pattern text compiled with
+        # e.g. re.IGNORECASE must not share a mask with the plain compile.
+        mask_key = ("matches", (rx.pattern, getattr(rx, "flags", 0)))
+        non_match_mask = ctx.masks.get(mask_key)
+        if non_match_mask is None:
+            if (
+                pc is not None
+                and isinstance(series.dtype, pd.ArrowDtype)
+                # Arrow's kernel only sees the pattern text, so compile
+                # flags beyond the implicit UNICODE bit (IGNORECASE,
+                # DOTALL, ...) would be dropped — those patterns take the
+                # per-value path below instead.
+                and not getattr(rx, "flags", 0) & ~re.UNICODE
+            ):
+                # RE2 kernel over the Arrow buffer; anchor to keep
+                # re.match (match-at-start) semantics.
+                matched = pc.match_substring_regex(
+                    series.array._pa_array, f"^(?:{rx.pattern})"
+                )
+                match_mask = matched.fill_null(False).to_numpy(zero_copy_only=False)
+                non_match_mask = ~match_mask & ~na_mask
+            elif pd.api.types.is_string_dtype(series):
+                # Pattern was compiled at build time; scan the raw values,
+                # skipping nulls up front instead of coercing via
+                # astype(str). Every non-null value is already str here,
+                # so no coercion at all.
+                non_match_mask = np.fromiter(
+                    (
+                        not is_na and rx.match(val) is None
+                        for val, is_na in zip(series.to_numpy(), na_mask)
+                    ),
+                    dtype=bool,
+                    count=len(series),
+                )
+            else:
+                non_match_mask = np.fromiter(
+                    (
+                        not is_na
+                        and rx.match(val if isinstance(val, str) else str(val)) is None
+                        for val, is_na in zip(series.to_numpy(), na_mask)
+                    ),
+                    dtype=bool,
+                    count=len(series),
+                )
+            ctx.cache_mask(mask_key, non_match_mask)
+        if not non_match_mask.any():
+            return batch.add(
                 check_name="matches",
+                column=spec.column,
+                passed=True,
+                message="All values match pattern",
+            )
+
+        failing = int(np.count_nonzero(non_match_mask))
+        return batch.add(
+            check_name="matches",
+            column=spec.column,
+            passed=False,
+            message=f"Found {failing} values not matching pattern",
+            failing_count=failing,
+            failing_examples=self._first_failing(spec.column, non_match_mask),
+        )
+
+    def _run_min_value(self, spec: CheckSpec, ctx: _ColumnContext, batch: ResultBatch) -> None:
+        col = spec.column
+        (minimum,) = spec.args
+        if not pd.api.types.is_numeric_dtype(ctx.series):
+            return batch.add(
+                check_name="min_value",
                 column=col,
-                passed=bool(failing == 0),
-                message=f"Found {failing} values not matching pattern" if failing > 0 else "All values match pattern",
-                failing_count=failing,
-                failing_examples=self.df[non_match_mask][col].tolist()[:5],
+                passed=False,
+                message=f"Column '{col}' is not numeric",
             )
-        
-        return self._add_check("matches", check)
 
-    def min_value(self, minimum: float) -> "DataValidator":
-        """Check that numeric values are at least the specified minimum."""
-        col = self._current_column
-        
-        def check() -> ValidationResult:
-            series = self.df[col]
-            if not pd.api.types.is_numeric_dtype(series):
-                return ValidationResult(
-                    check_name="min_value",
-                    column=col,
-                    passed=False,
-                    message=f"Column '{col}' is not numeric",
-                )
-            
-            below_min_mask = series < minimum
-            failing = below_min_mask.sum()
-            
-            return ValidationResult(
+        below_min_mask = ctx.masks.get((spec.op, spec.args))
+        if below_min_mask is None:
+            below_min_mask = numeric_failing_mask(ctx.numeric_arr(), OP_MIN, float(minimum))
+            ctx.cache_mask((spec.op, spec.args), below_min_mask)
+        if not below_min_mask.any():
+            return batch.add(
                 check_name="min_value",
                 column=col,
-                passed=bool(failing == 0),
-                message=f"Found {failing} values below {minimum}" if failing > 0 else f"All values >= {minimum}",
-                failing_count=failing,
-                failing_examples=self.df[below_min_mask][col].tolist()[:5],
+                passed=True,
+                message=f"All values >= {minimum}",
             )
-        
-        return self._add_check("min_value", check)
 
-    def max_value(self, maximum: float) -> "DataValidator":
-        """Check that numeric values are at most the specified maximum."""
-        col = self._current_column
-        
-        def check() -> ValidationResult:
-            series = self.df[col]
-            if not pd.api.types.is_numeric_dtype(series):
-                return ValidationResult(
-                    check_name="max_value",
-                    column=col,
-                    passed=False,
-                    message=f"Column '{col}' is not numeric",
-                )
-            
-            above_max_mask = series > maximum
-            failing = above_max_mask.sum()
-            
-            return ValidationResult(
+        failing = int(np.count_nonzero(below_min_mask))
+        return batch.add(
+            check_name="min_value",
+            column=col,
+            passed=False,
+            message=f"Found {failing} values below {minimum}",
+            failing_count=failing,
+            failing_examples=self._first_failing(col, below_min_mask),
+        )
+
+    def _run_max_value(self, spec: CheckSpec, ctx: _ColumnContext, batch: ResultBatch) -> None:
+        col = spec.column
+        (maximum,) = spec.args
+        if not pd.api.types.is_numeric_dtype(ctx.series):
+            return batch.add(
                 check_name="max_value",
                 column=col,
-                passed=bool(failing == 0),
-                message=f"Found {failing} values above {maximum}" if failing > 0 else f"All values <= {maximum}",
-                failing_count=failing,
-                failing_examples=self.df[above_max_mask][col].tolist()[:5],
+                passed=False,
+                message=f"Column '{col}' is not numeric",
             )
-        
-        return self._add_check("max_value", check)
 
-    def is_unique(self) -> "DataValidator":
-        """Check that all values in the current column are unique."""
-        col = self._current_column
-        
-        def check() -> ValidationResult:
-            series = self.df[col]
-            duplicate_mask = series.duplicated(keep=False)
-            failing = duplicate_mask.sum()
-            
-            return ValidationResult(
-                check_name="is_unique",
+        above_max_mask = ctx.masks.get((spec.op, spec.args))
+        if above_max_mask is None:
+            above_max_mask = numeric_failing_mask(ctx.numeric_arr(), OP_MAX, float(maximum))
+            ctx.cache_mask((spec.op, spec.args), above_max_mask)
+        if not above_max_mask.any():
+            return batch.add(
+                check_name="max_value",
                 column=col,
-                passed=bool(failing == 0),
-                message=f"Found {failing} duplicate values" if failing > 0 else "All values unique",
-                failing_count=failing,
-                failing_examples=series[series.duplicated(keep='first')].tolist()[:5],
+                passed=True,
+                message=f"All values <= {maximum}",
+            )
+
+        failing = int(np.count_nonzero(above_max_mask))
+        return batch.add(
+            check_name="max_value",
+            column=col,
+            passed=False,
+            message=f"Found {failing} values above {maximum}",
+            failing_count=failing,
+            failing_examples=self._first_failing(col, above_max_mask),
+        )
+
+    def _run_is_unique(self, spec: CheckSpec, ctx: _ColumnContext, batch: ResultBatch) -> None:
+        # Series.duplicated runs pandas' type-specialized C hashtable in a
+        # single pass; keep=False flags every member of a duplicate group,
+        # so the count matches the original "Found N duplicate values"
+        # semantics ([1, 1, 1, 2, 3] reports 3, not 2).
+        dup_mask = ctx.masks.get(("is_unique", ()))
+        if dup_mask is None:
+            dup_mask = ctx.series.duplicated(keep=False).to_numpy()
+            ctx.cache_mask(("is_unique", ()), dup_mask)
+        if not dup_mask.any():
+            return batch.add(
+                check_name="is_unique",
+                column=spec.column,
+                passed=True,
+                message="All values unique",
             )
-        
-        return self._add_check("is_unique", check)
 
-    def run(self) -> list[ValidationResult]:
+        failing = int(np.count_nonzero(dup_mask))
+        return batch.add(
+            check_name="is_unique",
+            column=spec.column,
+            passed=False,
+            message=f"Found {failing} duplicate values",
+            failing_count=failing,
+            failing_examples=self._first_failing(spec.column, dup_mask),
+        )
+
+    _DISPATCH = {
+        "is_not_null": _run_is_not_null,
+        "is_positive": _run_is_positive,
+        "is_in": _run_is_in,
+        "matches": _run_matches,
+        "min_value": _run_min_value,
+        "max_value": _run_max_value,
+        "is_unique": _run_is_unique,
+    }
+
+    def run(self) -> ResultBatch:
         """
         Execute all queued validation checks.
 
+        The Series and null mask for each column are resolved once and
+        shared by every check on that column, so chained checks do not
+        re-scan the column for nulls.
+
+        Checks on different columns are independent, so on large inputs
+        (rows x checks above PARALLEL_THRESHOLD) each column's chain runs
+        on its own thread; pandas and NumPy release the GIL in their
+        hashtable and ufunc loops, so the scans genuinely overlap.
+
         Returns:
-            A list of ValidationResult objects.
+            A ResultBatch, indexable and iterable like a list of
+            ValidationResult objects, in the order the checks were added.
+        """
+        self._fuse_numeric_checks()
+        self._fuse_matches_checks()
+
+        groups: dict[str | None, list[CheckSpec]] = {}
+        for spec in self._checks:
+            groups.setdefault(spec.column, []).append(spec)
+
+        if (
+            len(groups) >= 2
+            and len(self.df) * len(self._checks) >= PARALLEL_THRESHOLD
+        ):
+            return self._run_parallel(groups)
+
+        batch = ResultBatch()
+        for spec in self._checks:
+            ctx = self._context_for(spec.column)
+            self._DISPATCH[spec.op](self, spec, ctx, batch)
+
+        return batch
+
+    def _run_parallel(self, groups: dict[str | None, list[CheckSpec]]) -> ResultBatch:
+        """
+        Run each column's checks on its own thread.
+
+        Contexts are resolved up front on the calling thread (workers only
+        read shared state), each worker fills a private ResultBatch, and
+        the per-column batches are stitched back into the order the checks
+        were added.
+        """
+        for column in groups:
+            self._context_for(column)
+
+        def run_group(specs: list[CheckSpec]) -> ResultBatch:
+            ctx = self._contexts[specs[0].column]
+            group_batch = ResultBatch()
+            for spec in specs:
+                self._DISPATCH[spec.op](self, spec, ctx, group_batch)
+            return group_batch
+
+        workers = min(len(groups), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            column_batches = dict(zip(groups, pool.map(run_group, groups.values())))
+
+        batch = ResultBatch()
+        cursors = dict.fromkeys(groups, 0)
+        for spec in self._checks:
+            src = column_batches[spec.column]
+            i = cursors[spec.column]
+            cursors[spec.column] = i + 1
+            batch.add(
+                check_name=src.check_names[i],
+                passed=src.passed[i],
+                column=src.columns[i],
+                message=src.messages[i],
+                failing_count=src.failing_counts[i],
+                failing_examples=src.failing_examples[i],
+            )
+        return batch
+
+    def _context_for(self, column: str | None) -> _ColumnContext:
+        """Get or build the shared context for a column."""
+        ctx = self._contexts.get(column)
+        if ctx is None:
+            series = self.df[column]
+            ctx = self._contexts[column] = _ColumnContext(series, _na_mask(series))
+        return ctx
+
+    def _fuse_numeric_checks(self) -> None:
+        """
+        Precompute predicate masks for columns with several numeric checks.
+
+        All of a column's numeric predicates are evaluated by one fused
+        kernel pass over its shared buffer; executors pick their mask out
+        of the context instead of scanning again. With the optional
+        numexpr backend, the conjunction of all predicates is tried first
+        in a single multi-threaded expression — on clean data (the common
+        case) every check passes and no per-predicate mask is ever built.
+        """
+        groups: dict[str | None, list[CheckSpec]] = {}
+        for spec in self._checks:
+            if spec.op in _NUMERIC_OPS:
+                groups.setdefault(spec.column, []).append(spec)
+
+        for column, specs in groups.items():
+            if len(specs) < 2 or not pd.api.types.is_numeric_dtype(self.df[column]):
+                continue
+            ctx = self._context_for(column)
+            if ne is not None and self._all_pass_numexpr(ctx.numeric_arr(), specs):
+                # One shared all-False failing mask satisfies every check.
+                clean = np.zeros(len(ctx.series), dtype=bool)
+                for spec in specs:
+                    ctx.masks.setdefault((spec.op, spec.args), clean)
+                continue
+            ops = np.array([_numeric_op(s)[0] for s in specs], dtype=np.int64)
+            bounds = np.array([_numeric_op(s)[1] for s in specs], dtype=np.float64)
+            masks = fused_numeric_masks(ctx.numeric_arr(), ops, bounds)
+            for spec, mask in zip(specs, masks):
+                ctx.masks.setdefault((spec.op, spec.args), mask)
+
+    @staticmethod
+    def _all_pass_numexpr(arr: np.ndarray, specs: list[CheckSpec]) -> bool:
+        """
+        Evaluate the conjunction of a column's numeric predicates at once.
+
+        Builds e.g. "(x > 0) & (x <= b1)" and lets numexpr run it as one
+        fused loop. Returns True only when every row satisfies every
+        predicate. NaN rows make the conjunction False even though nulls
+        never fail individual checks, so a null column simply falls back
+        to the per-predicate kernel — the fast path is skipped, never
+        wrong.
+        """
+        parts = []
+        local_dict: dict[str, Any] = {"x": arr}
+        for i, spec in enumerate(specs):
+            op, bound = _numeric_op(spec)
+            if arr.dtype.kind in "iu" and float(bound).is_integer():
+                # Keep integral bounds exact for integer columns; a
+                # float64 bound would round beyond 2**53.
+                bound = int(bound)
+            local_dict[f"b{i}"] = bound
+            if op == OP_POSITIVE:
+                parts.append("(x > 0)")
+            elif op == OP_MIN:
+                parts.append(f"(x >= b{i})")
+            else:
+                parts.append(f"(x <= b{i})")
+        combined = ne.evaluate(" & ".join(parts), local_dict=local_dict)
+        return bool(combined.all())
+
+    def _fuse_matches_checks(self) -> None:
+        """
+        Precompute match masks for columns with several regex checks.
+
+        With the optional google-re2 backend, all of a column's patterns
+        are compiled into one RE2 set and every value is scanned once —
+        the DFA reports which patterns matched per value — instead of one
+        scan per pattern. Without re2, or for patterns RE2 cannot compile,
+        the per-pattern path in _run_matches is used unchanged.
         """
-        return [check_fn() for _, _, check_fn in self._checks]
\ No newline at end of file
+        if re2 is None:
+            return
+
+        groups: dict[str | None, list[CheckSpec]] = {}
+        for spec in self._checks:
+            if spec.op == "matches":
+                groups.setdefault(spec.column, []).append(spec)
+
+        for column, specs in groups.items():
+            # Distinct (pattern, flags) pairs only; repeats already share
+            # a cached mask. The pairs match the _run_matches cache key.
+            # A set entry cannot carry compile flags, so patterns with
+            # anything beyond the implicit UNICODE bit stay out of the
+            # fusion and run through _run_matches, which honors them.
+            keys = list(dict.fromkeys(
+                (rx.pattern, getattr(rx, "flags", 0))
+                for rx in (spec.args[0] for spec in specs)
+                if not getattr(rx, "flags", 0) & ~re.UNICODE
+            ))
+            if len(keys) < 2:
+                continue
+
+            rx_set = re2.Set.MatchSet()
+            try:
+                for pattern, _ in keys:
+                    rx_set.Add(pattern)
+                rx_set.Compile()
+            except re2.error:
+                continue
+
+            ctx = self._context_for(column)
+            na_mask = ctx.na_mask
+            values = ctx.series.to_numpy()
+            non_match = np.zeros((len(keys), len(values)), dtype=bool)
+            for i, (val, is_na) in enumerate(zip(values, na_mask)):
+                if is_na:
+                    continue
+                non_match[:, i] = True
+                matched = rx_set.Match(val if isinstance(val, str) else str(val))
+                if matched:
+                    non_match[matched, i] = False
+
+            for key, mask in zip(keys, non_match):
+                ctx.masks.setdefault(("matches", key), mask)
@@ -0,0 +1,17 @@
+"""Shared pytest configuration."""
+
+import pandas as pd
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def copy_on_write():
+    """
+    Enable pandas copy-on-write for the whole session.
+
+    Fixtures are shared at module scope, so accidental in-place mutation
+    of a fixture frame must not leak between tests. On pandas >= 3.0
+    copy-on-write is always on and the option no longer exists.
+    """
+    if int(pd.__version__.split(".")[0]) < 3:
+        pd.set_option("mode.copy_on_write", True)
@@ -6,9 +6,9 @@ import pytest
 from dqcheck import DataProfiler
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_df():
-    """Create a sample DataFrame for testing."""
+    """Create a sample DataFrame shared by every test in this module."""
     return pd.DataFrame({
         "id": [1, 2, 3, 4, 5],
         "name": ["Alice", "Bob", "Charlie", None, "Eve"],
@@ -16,6 +16,14 @@ def sample_df():
     })
 
 
+class TestModuleExports:
+    """Smoke tests for the profiler module surface."""
+
+    def test_profiler_exposes_partition_recommendations(self):
+        # Guards against a stripped-down DataProfiler shadowing the full one.
+        assert hasattr(DataProfiler, "partition_recommendations")
+
+
 class TestProfileColumn:
     """Tests for column profiling."""
 
@@ -46,6 +54,15 @@ class TestProfileColumn:
         assert "max_length" in profile
         assert "avg_length" in profile
 
+    def test_mixed_object_column(self):
+        df = pd.DataFrame({"mixed": pd.Series([1, "x", 3.5], dtype=object)})
+        profile = DataProfiler(df).profile_column("mixed")
+
+        # Non-string values are measured by their str form: "1", "x", "3.5".
+        assert profile["min_length"] == 1
+        assert profile["max_length"] == 3
+        assert profile["avg_length"] == round(5 / 3, 2)
+
     def test_handles_nulls(self, sample_df):
         profiler = DataProfiler(sample_df)
         profile = profiler.profile_column("name")